@@ -5,10 +5,18 @@ Output formats: RDF (Turtle) and CSV
 """
 
 import pandas as pd
+import numpy as np
 from rdflib import Graph, Namespace, Literal, URIRef
 from rdflib.namespace import RDF, DCTERMS, XSD, FOAF
+from rdflib.plugins.stores.memory import SimpleMemory
 import os
-from datetime import datetime
+import re
+import argparse
+import importlib.util
+import multiprocessing as mp
+from contextlib import ExitStack
+from functools import lru_cache, partial
+
 # Add this at the very beginning, right after imports
 import sys
 import io
@@ -21,307 +29,653 @@ if sys.stdout.encoding != 'utf-8':
 DCAT = Namespace("http://www.w3.org/ns/dcat#")
 DCT = Namespace("http://purl.org/dc/terms/")
 DATAGOV = Namespace("https://data.gov.in")
+FREQ = Namespace("http://purl.org/cld/freq/")
+
+# Predicates, classes and datatypes resolved once; Namespace attribute
+# access builds a new URIRef on every lookup
+DCT_TITLE = DCT.title
+DCT_DESC = DCT.description
+DCT_ISSUED = DCT.issued
+DCT_MODIFIED = DCT.modified
+DCT_CREATED = DCT.created
+DCT_PUBLISHER = DCT.publisher
+DCT_ACCRUAL = DCT.accrualPeriodicity
+DCT_SUBJECT = DCT.subject
+DCT_FORMAT = DCT['format']
+DCAT_LANDING = DCAT.landingPage
+DCAT_THEME = DCAT.theme
+DCAT_DATASET = DCAT.Dataset
+DCAT_DIST = DCAT.Distribution
+DCAT_DISTRIBUTION = DCAT.distribution
+DCAT_ACCESS = DCAT.accessURL
+DCAT_DOWNLOAD = DCAT.downloadURL
+DCAT_MEDIA = DCAT.mediaType
+DCAT_BYTESIZE = DCAT.byteSize
+XSD_DATE = XSD.date
+XSD_INT = XSD.integer
+RDF_TYPE = RDF.type
+
+# RDF serialization formats and their file extensions
+RDF_EXTENSIONS = {'turtle': 'ttl', 'jelly': 'jelly', 'nt': 'nt'}
+
+# Characters that must be escaped inside N-Triples and Turtle string literals
+NT_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+# Characters that are not allowed in an N-Triples/Turtle IRI reference
+INVALID_IRI_CHARS = re.compile(r'[\x00-\x20<>"{}|\\^`]')
+
+# Frequency terms mapped to the Dublin Core Collection Description vocabulary
+FREQ_MAPPING = {
+    'daily': 'http://purl.org/cld/freq/daily',
+    'weekly': 'http://purl.org/cld/freq/weekly',
+    'monthly': 'http://purl.org/cld/freq/monthly',
+    'yearly': 'http://purl.org/cld/freq/annual',
+    'quarterly': 'http://purl.org/cld/freq/quarterly'
+}
+
+# Prefixes declared at the top of Turtle output
+TURTLE_PREFIXES = {'dcat': DCAT, 'dcterms': DCT, 'freq': FREQ, 'xsd': XSD}
+
+# Prefixed names for the IRIs used as predicates, classes, datatypes and
+# frequencies; any other IRI is written in full
+TURTLE_NAMES = {
+    iri: f"{prefix}:{iri[len(str(ns)):]}"
+    for iri in [
+        DCT_TITLE, DCT_DESC, DCT_ISSUED, DCT_MODIFIED, DCT_CREATED, DCT_PUBLISHER,
+        DCT_ACCRUAL, DCT_SUBJECT, DCT_FORMAT, DCAT_LANDING, DCAT_THEME, DCAT_DATASET,
+        DCAT_DIST, DCAT_DISTRIBUTION, DCAT_ACCESS, DCAT_DOWNLOAD, DCAT_MEDIA,
+        DCAT_BYTESIZE, XSD_DATE, XSD_INT, *map(URIRef, FREQ_MAPPING.values())
+    ]
+    for prefix, ns in TURTLE_PREFIXES.items() if iri.startswith(str(ns))
+}
+TURTLE_NAMES[RDF_TYPE] = 'a'
+
+# Number of input rows converted at a time
+CHUNK_SIZE = 50_000
+
+# Column order of the CSV outputs
+DUBLIN_COLUMNS = [
+    'dataset_uri', 'title', 'description', 'issued', 'modified', 'created',
+    'publisher', 'accrualPeriodicity', 'subject', 'landingPage'
+]
+DCAT_COLUMNS = [
+    'dataset_uri', 'distribution_uri', 'distribution_type', 'accessURL',
+    'downloadURL', 'format', 'byteSize', 'title'
+]
+
+# Input columns read by the graph builders
+INPUT_FIELDS = [
+    'title', 'catalog_title', 'note', 'ministry_department', 'state_department',
+    'published_date', 'changed', 'created', 'sector', 'frequency', 'node_alias',
+    'datafile', 'datafile_url', 'file_format', 'file_size'
+]
+
+class CSVReadError(Exception):
+    """Raised when the input CSV fails to parse part-way through reading"""
 
-def parse_csv(filepath):
-    """Parse the input CSV file"""
+def read_chunks(reader):
+    """Yield chunks from a read_csv iterator, tagging parse errors as CSVReadError"""
     try:
-        df = pd.read_csv(filepath)
-        print(f"Successfully loaded {len(df)} records from {filepath}")
-        return df
+        yield from reader
+    except Exception as e:
+        raise CSVReadError(e) from e
+
+def parse_csv(filepath, chunksize=CHUNK_SIZE):
+    """Open the input CSV file as an iterator of DataFrame chunks"""
+    try:
+        # Input columns are read as text so that type inference on each chunk
+        # cannot make the output depend on where chunk boundaries fall
+        reader = pd.read_csv(
+            filepath, chunksize=chunksize, dtype={field: str for field in INPUT_FIELDS}
+        )
     except Exception as e:
         print(f"Error reading CSV: {e}")
         return None
+    # Chunked reading only parses rows as they are requested, so later
+    # errors surface while iterating
+    return read_chunks(reader)
+
+def discard_files(paths):
+    """Remove any of the given files that exist"""
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def normalize_frequency(values):
+    """Normalize a column of frequency terms to standard vocabulary"""
+    freq_lower = pd.Series(values, dtype=object).astype(str).str.lower().str.strip()
+    normalized = freq_lower.map(FREQ_MAPPING).fillna(freq_lower)
+    return np.where(pd.notna(values), normalized, None)
+
+def parse_dates(values):
+    """Parse a column of date strings to ISO format, trying each known format in turn"""
+    text = pd.Series(values, dtype=object).astype(str)
+    parsed = None
+    for fmt in ['%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y']:
+        attempt = pd.to_datetime(text, format=fmt, errors='coerce')
+        parsed = attempt if parsed is None else parsed.fillna(attempt)
+    # Unparseable dates are passed through unchanged, missing ones become None
+    iso = np.where(parsed.notna(), parsed.dt.strftime('%Y-%m-%d'), text)
+    return np.where(pd.notna(values), iso, None)
 
-def normalize_frequency(freq):
-    """Normalize frequency terms to standard vocabulary"""
-    freq_mapping = {
-        'daily': 'http://purl.org/cld/freq/daily',
-        'weekly': 'http://purl.org/cld/freq/weekly',
-        'monthly': 'http://purl.org/cld/freq/monthly',
-        'yearly': 'http://purl.org/cld/freq/annual',
-        'quarterly': 'http://purl.org/cld/freq/quarterly'
+def get_columns(df):
+    """Extract input columns as object arrays for positional row access"""
+    missing = np.full(len(df), None, dtype=object)
+    return {
+        field: df[field].to_numpy(dtype=object) if field in df else missing
+        for field in INPUT_FIELDS
     }
-    if pd.notna(freq):
-        freq_lower = str(freq).lower().strip()
-        return freq_mapping.get(freq_lower, freq_lower)
-    return None
-
-def parse_date(date_str):
-    """Parse date string to standard format"""
-    if pd.isna(date_str):
-        return None
-    try:
-        # Try different date formats
-        for fmt in ['%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y']:
-            try:
-                dt = datetime.strptime(str(date_str), fmt)
-                return dt.strftime('%Y-%m-%d')
-            except:
-                continue
-        return str(date_str)
-    except:
-        return None
 
-def get_publisher(row):
-    """Get publisher from ministry_department or state_department"""
-    if pd.notna(row.get('ministry_department')):
-        return str(row['ministry_department'])
-    elif pd.notna(row.get('state_department')):
-        return str(row['state_department'])
-    return None
-
-def get_description(row):
-    """Get description from catalog_title or note"""
-    if pd.notna(row.get('catalog_title')):
-        desc = str(row['catalog_title'])
-        if pd.notna(row.get('note')):
-            desc += ". " + str(row['note'])
-        return desc
-    elif pd.notna(row.get('note')):
-        return str(row['note'])
-    return None
-
-def create_dublin_core_graph(df):
-    """Create RDF graph for Dublin Core metadata"""
-    g = Graph()
-    g.bind("dct", DCT)
-    g.bind("dcterms", DCTERMS)
+def split_sectors(values):
+    """Split a column of ';'-separated sectors into lists of stripped names"""
+    text = pd.Series(values, dtype=object).astype(str).str.strip()
+    parts = text.str.split(r'\s*;\s*', regex=True)
+    return [
+        sectors if present else None
+        for sectors, present in zip(parts, pd.notna(values))
+    ]
+
+def parse_sizes(values):
+    """Parse a column of file sizes to exact ints, keeping only plain whole numbers"""
+    text = pd.Series(values, dtype=object).astype(str)
+    # "1464" and "1464.0" are byte counts; fractions, exponents ("1e3") and
+    # anything else are dropped rather than rounded or truncated
+    whole = text.str.fullmatch(r'\s*[+-]?\d+(\.0*)?\s*').fillna(False).to_numpy(dtype=bool)
+    return [
+        int(size.split('.')[0]) if ok else None
+        for size, ok in zip(text, whole & pd.notna(values))
+    ]
+
+def build_dataset_iris(node_aliases, index):
+    """Build dataset IRIs from node aliases, falling back to the row index"""
+    aliases = pd.Series(node_aliases, dtype=object)
+    from_alias = ('https://data.gov.in' + aliases.astype(str)).to_numpy(dtype=object)
+    fallback = ('https://data.gov.in/dataset/' + index.astype(str)).to_numpy(dtype=object)
+    return np.where(aliases.notna().to_numpy(), from_alias, fallback)
+
+def build_publishers(ministry_departments, state_departments):
+    """Take publishers from ministry_department, falling back to state_department"""
+    ministry = pd.Series(ministry_departments, dtype=object)
+    state = pd.Series(state_departments, dtype=object)
+    publishers = np.where(
+        ministry.notna().to_numpy(),
+        ministry.astype(str).to_numpy(dtype=object),
+        np.where(state.notna().to_numpy(), state.astype(str).to_numpy(dtype=object), None)
+    )
+    # Empty publishers are treated as missing
+    publishers[publishers == ''] = None
+    return publishers
+
+def build_descriptions(catalog_titles, notes):
+    """Build descriptions from catalog_title, with the note appended when both are present"""
+    catalog = pd.Series(catalog_titles, dtype=object)
+    note = pd.Series(notes, dtype=object)
+    catalog_text = catalog.fillna('').astype(str).to_numpy(dtype=object)
+    note_text = note.fillna('').astype(str).to_numpy(dtype=object)
+    has_note = note.notna().to_numpy()
+    descriptions = np.where(
+        catalog.notna().to_numpy(),
+        np.where(has_note, catalog_text + ". " + note_text, catalog_text),
+        np.where(has_note, note_text, None)
+    )
+    # Empty descriptions are treated as missing
+    descriptions[descriptions == ''] = None
+    return descriptions
+
+def build_dcat_table(cols, iri_col):
+    """Build the DCAT CSV table: an API row and/or a File row per input row"""
+    api_pos = np.flatnonzero(pd.notna(cols['datafile_url']))
+    file_pos = np.flatnonzero(pd.notna(cols['datafile']))
+    pos = np.concatenate([api_pos, file_pos])
+    is_file = np.concatenate([
+        np.zeros(len(api_pos), dtype=bool), np.ones(len(file_pos), dtype=bool)
+    ])
+    # Keep input row order, with the API distribution ahead of the File one
+    order = np.lexsort((is_file, pos))
+    pos = pos[order]
+    is_file = is_file[order]
+    iris = iri_col[pos]
+    return pd.DataFrame({
+        'dataset_uri': iris,
+        'distribution_uri': iris + np.where(
+            is_file, '/distribution/file', '/distribution/api'
+        ).astype(object),
+        'distribution_type': np.where(is_file, 'File', 'API').astype(object),
+        'accessURL': np.where(is_file, None, cols['datafile_url'][pos]),
+        'downloadURL': np.where(is_file, cols['datafile'][pos], None),
+        'format': cols['file_format'][pos],
+        'byteSize': cols['file_size'][pos],
+        'title': cols['title'][pos]
+    }, columns=DCAT_COLUMNS)
+
+def is_present(value):
+    """Check that a scalar from an object column is not missing (None or NaN)"""
+    # NaN is the only value that is not equal to itself
+    return value is not None and value == value
+
+@lru_cache(maxsize=4096, typed=True)
+def cached_literal(value, datatype=None):
+    """Return a shared Literal for values that repeat across rows (formats, sizes, publishers, dates)"""
+    return Literal(value, datatype=datatype)
+
+def convert_rows(df, rdf=True, csv=True):
+    """Convert input rows to Dublin Core and DCAT triples and CSV tables in a single pass
+
+    Outputs that are not requested are skipped and returned as None.
+    """
+    cols = get_columns(df)
+    issued_col = parse_dates(cols['published_date'])
+    modified_col = parse_dates(cols['changed'])
+    created_col = parse_dates(cols['created'])
+    freq_col = normalize_frequency(cols['frequency'])
+    iri_col = build_dataset_iris(cols['node_alias'], df.index)
+    desc_col = build_descriptions(cols['catalog_title'], cols['note'])
+    publisher_col = build_publishers(cols['ministry_department'], cols['state_department'])
+    
+    # Both CSV tables are built column-wise from the derived arrays
+    dc_df = dcat_df = None
+    if csv:
+        dc_df = pd.DataFrame({
+            'dataset_uri': iri_col,
+            'title': cols['title'],
+            'description': desc_col,
+            'issued': issued_col,
+            'modified': modified_col,
+            'created': created_col,
+            'publisher': publisher_col,
+            'accrualPeriodicity': freq_col,
+            'subject': cols['sector'],
+            'landingPage': np.where(pd.notna(cols['node_alias']), iri_col, None)
+        }, columns=DUBLIN_COLUMNS, copy=False)
+        dcat_df = build_dcat_table(cols, iri_col)
+    if not rdf:
+        return None, dc_df, None, dcat_df
     
-    dublin_data = []
+    # Triples are collected per output so callers can batch-insert or stream them
+    dc_triples = []
+    dcat_triples = []
+    add_dc = dc_triples.append
+    add_dcat = dcat_triples.append
+    
+    sector_col = split_sectors(cols['sector'])
+    size_col = parse_sizes(cols['file_size'])
+    
+    # Frequencies repeat heavily, so build one term per distinct value
+    freq_terms = {
+        freq: URIRef(freq) if freq.startswith('http') else Literal(freq)
+        for freq in set(freq_col) if freq
+    }
     
-    for idx, row in df.iterrows():
+    for i in range(len(df)):
         # Create dataset URI
-        node_alias = row.get('node_alias', '')
-        if pd.notna(node_alias):
-            dataset_uri = URIRef(f"https://data.gov.in{node_alias}")
-        else:
-            dataset_uri = URIRef(f"https://data.gov.in/dataset/{idx}")
+        node_alias = cols['node_alias'][i]
+        dataset_iri = iri_col[i]
+        dataset_uri = URIRef(dataset_iri)
+        
+        # Dataset type (DCAT only)
+        add_dcat((dataset_uri, RDF_TYPE, DCAT_DATASET))
         
         # Title
-        if pd.notna(row.get('title')):
-            g.add((dataset_uri, DCT.title, Literal(row['title'])))
+        title = cols['title'][i]
+        if is_present(title):
+            title_term = Literal(title)
+            add_dc((dataset_uri, DCT_TITLE, title_term))
+            add_dcat((dataset_uri, DCT_TITLE, title_term))
         
         # Description
-        desc = get_description(row)
+        desc = desc_col[i]
         if desc:
-            g.add((dataset_uri, DCT.description, Literal(desc)))
+            desc_term = Literal(desc)
+            add_dc((dataset_uri, DCT_DESC, desc_term))
+            add_dcat((dataset_uri, DCT_DESC, desc_term))
         
         # Issued (published_date)
-        issued = parse_date(row.get('published_date'))
+        issued = issued_col[i]
         if issued:
-            g.add((dataset_uri, DCT.issued, Literal(issued, datatype=XSD.date)))
+            issued_term = cached_literal(issued, XSD_DATE)
+            add_dc((dataset_uri, DCT_ISSUED, issued_term))
+            add_dcat((dataset_uri, DCT_ISSUED, issued_term))
         
         # Modified (changed)
-        modified = parse_date(row.get('changed'))
+        modified = modified_col[i]
         if modified:
-            g.add((dataset_uri, DCT.modified, Literal(modified, datatype=XSD.date)))
+            modified_term = cached_literal(modified, XSD_DATE)
+            add_dc((dataset_uri, DCT_MODIFIED, modified_term))
+            add_dcat((dataset_uri, DCT_MODIFIED, modified_term))
         
-        # Created
-        created = parse_date(row.get('created'))
+        # Created (Dublin Core only)
+        created = created_col[i]
         if created:
-            g.add((dataset_uri, DCT.created, Literal(created, datatype=XSD.date)))
+            add_dc((dataset_uri, DCT_CREATED, cached_literal(created, XSD_DATE)))
         
         # Publisher
-        publisher = get_publisher(row)
+        publisher = publisher_col[i]
         if publisher:
-            g.add((dataset_uri, DCT.publisher, Literal(publisher)))
+            publisher_term = cached_literal(publisher)
+            add_dc((dataset_uri, DCT_PUBLISHER, publisher_term))
+            add_dcat((dataset_uri, DCT_PUBLISHER, publisher_term))
         
         # Accrual Periodicity (frequency)
-        freq = normalize_frequency(row.get('frequency'))
+        freq = freq_col[i]
         if freq:
-            if freq.startswith('http'):
-                g.add((dataset_uri, DCT.accrualPeriodicity, URIRef(freq)))
-            else:
-                g.add((dataset_uri, DCT.accrualPeriodicity, Literal(freq)))
+            freq_term = freq_terms[freq]
+            add_dc((dataset_uri, DCT_ACCRUAL, freq_term))
+            add_dcat((dataset_uri, DCT_ACCRUAL, freq_term))
         
         # Subject/Theme (sector)
-        if pd.notna(row.get('sector')):
-            sectors = str(row['sector']).split(';')
-            for sector in sectors:
-                g.add((dataset_uri, DCT.subject, Literal(sector.strip())))
-        
-        # Landing Page
-        if pd.notna(node_alias):
-            landing_page = f"https://data.gov.in{node_alias}"
-            g.add((dataset_uri, DCAT.landingPage, URIRef(landing_page)))
-        
-        # Collect data for CSV
-        dublin_data.append({
-            'dataset_uri': str(dataset_uri),
-            'title': row.get('title'),
-            'description': desc,
-            'issued': issued,
-            'modified': modified,
-            'created': created,
-            'publisher': publisher,
-            'accrualPeriodicity': freq,
-            'subject': row.get('sector'),
-            'landingPage': f"https://data.gov.in{node_alias}" if pd.notna(node_alias) else None
-        })
-    
-    return g, pd.DataFrame(dublin_data)
-
-def create_dcat_graph(df):
-    """Create RDF graph for DCAT metadata"""
-    g = Graph()
-    g.bind("dcat", DCAT)
-    g.bind("dct", DCT)
-    g.bind("dcterms", DCTERMS)
-    
-    dcat_data = []
-    
-    for idx, row in df.iterrows():
-        # Create dataset URI
-        node_alias = row.get('node_alias', '')
-        if pd.notna(node_alias):
-            dataset_uri = URIRef(f"https://data.gov.in{node_alias}")
-        else:
-            dataset_uri = URIRef(f"https://data.gov.in/dataset/{idx}")
-        
-        # Dataset type
-        g.add((dataset_uri, RDF.type, DCAT.Dataset))
-        
-        # Basic metadata (same as Dublin Core)
-        if pd.notna(row.get('title')):
-            g.add((dataset_uri, DCT.title, Literal(row['title'])))
-        
-        desc = get_description(row)
-        if desc:
-            g.add((dataset_uri, DCT.description, Literal(desc)))
-        
-        issued = parse_date(row.get('published_date'))
-        if issued:
-            g.add((dataset_uri, DCT.issued, Literal(issued, datatype=XSD.date)))
-        
-        modified = parse_date(row.get('changed'))
-        if modified:
-            g.add((dataset_uri, DCT.modified, Literal(modified, datatype=XSD.date)))
-        
-        publisher = get_publisher(row)
-        if publisher:
-            g.add((dataset_uri, DCT.publisher, Literal(publisher)))
-        
-        freq = normalize_frequency(row.get('frequency'))
-        if freq:
-            if freq.startswith('http'):
-                g.add((dataset_uri, DCT.accrualPeriodicity, URIRef(freq)))
-            else:
-                g.add((dataset_uri, DCT.accrualPeriodicity, Literal(freq)))
-        
-        if pd.notna(row.get('sector')):
-            sectors = str(row['sector']).split(';')
+        sectors = sector_col[i]
+        if sectors is not None:
             for sector in sectors:
-                g.add((dataset_uri, DCAT.theme, Literal(sector.strip())))
+                sector_term = cached_literal(sector)
+                add_dc((dataset_uri, DCT_SUBJECT, sector_term))
+                add_dcat((dataset_uri, DCAT_THEME, sector_term))
         
-        if pd.notna(node_alias):
-            landing_page = f"https://data.gov.in{node_alias}"
-            g.add((dataset_uri, DCAT.landingPage, URIRef(landing_page)))
+        # Landing Page (the dataset URI itself)
+        if is_present(node_alias):
+            add_dc((dataset_uri, DCAT_LANDING, dataset_uri))
+            add_dcat((dataset_uri, DCAT_LANDING, dataset_uri))
         
-        # Distributions
-        dist_counter = 1
+        # Distributions (DCAT only)
+        datafile_url = cols['datafile_url'][i]
+        datafile = cols['datafile'][i]
+        file_format = cols['file_format'][i]
+        format_term = cached_literal(file_format) if is_present(file_format) else None
+        size = size_col[i]
+        size_term = cached_literal(size, XSD_INT) if size is not None else None
         
         # API Distribution (datafile_url)
-        if pd.notna(row.get('datafile_url')):
-            dist_uri = URIRef(f"{dataset_uri}/distribution/api")
-            g.add((dist_uri, RDF.type, DCAT.Distribution))
-            g.add((dataset_uri, DCAT.distribution, dist_uri))
-            g.add((dist_uri, DCAT.accessURL, URIRef(row['datafile_url'])))
-            
-            if pd.notna(row.get('file_format')):
-                g.add((dist_uri, DCT['format'], Literal(row['file_format'])))
-                g.add((dist_uri, DCAT.mediaType, Literal(row['file_format'])))
+        if is_present(datafile_url):
+            dist_uri = URIRef(f"{dataset_iri}/distribution/api")
+            add_dcat((dist_uri, RDF_TYPE, DCAT_DIST))
+            add_dcat((dataset_uri, DCAT_DISTRIBUTION, dist_uri))
+            add_dcat((dist_uri, DCAT_ACCESS, URIRef(datafile_url)))
             
-            if pd.notna(row.get('file_size')):
-                try:
-                    size = int(row['file_size'])
-                    g.add((dist_uri, DCAT.byteSize, Literal(size, datatype=XSD.integer)))
-                except:
-                    pass
+            if format_term is not None:
+                add_dcat((dist_uri, DCT_FORMAT, format_term))
+                add_dcat((dist_uri, DCAT_MEDIA, format_term))
             
-            dcat_data.append({
-                'dataset_uri': str(dataset_uri),
-                'distribution_uri': str(dist_uri),
-                'distribution_type': 'API',
-                'accessURL': row['datafile_url'],
-                'downloadURL': None,
-                'format': row.get('file_format'),
-                'byteSize': row.get('file_size'),
-                'title': row.get('title')
-            })
+            if size_term is not None:
+                add_dcat((dist_uri, DCAT_BYTESIZE, size_term))
         
         # File Download Distribution (datafile)
-        if pd.notna(row.get('datafile')):
-            dist_uri = URIRef(f"{dataset_uri}/distribution/file")
-            g.add((dist_uri, RDF.type, DCAT.Distribution))
-            g.add((dataset_uri, DCAT.distribution, dist_uri))
-            g.add((dist_uri, DCAT.downloadURL, URIRef(row['datafile'])))
-            
-            if pd.notna(row.get('file_format')):
-                g.add((dist_uri, DCT['format'], Literal(row['file_format'])))
-                g.add((dist_uri, DCAT.mediaType, Literal(row['file_format'])))
+        if is_present(datafile):
+            dist_uri = URIRef(f"{dataset_iri}/distribution/file")
+            add_dcat((dist_uri, RDF_TYPE, DCAT_DIST))
+            add_dcat((dataset_uri, DCAT_DISTRIBUTION, dist_uri))
+            add_dcat((dist_uri, DCAT_DOWNLOAD, URIRef(datafile)))
             
-            if pd.notna(row.get('file_size')):
-                try:
-                    size = int(row['file_size'])
-                    g.add((dist_uri, DCAT.byteSize, Literal(size, datatype=XSD.integer)))
-                except:
-                    pass
+            if format_term is not None:
+                add_dcat((dist_uri, DCT_FORMAT, format_term))
+                add_dcat((dist_uri, DCAT_MEDIA, format_term))
             
-            dcat_data.append({
-                'dataset_uri': str(dataset_uri),
-                'distribution_uri': str(dist_uri),
-                'distribution_type': 'File',
-                'accessURL': None,
-                'downloadURL': row['datafile'],
-                'format': row.get('file_format'),
-                'byteSize': row.get('file_size'),
-                'title': row.get('title')
-            })
+            if size_term is not None:
+                add_dcat((dist_uri, DCAT_BYTESIZE, size_term))
     
-    return g, pd.DataFrame(dcat_data)
+    return dc_triples, dc_df, dcat_triples, dcat_df
+
+def new_graph():
+    """Create an empty graph with every output namespace bound"""
+    # Graphs are only built to be serialized once, so use the lean store that
+    # keeps a single subject index instead of rdflib's fully indexed default.
+    # Every namespace is bound up front so serializers never have to invent prefixes.
+    g = Graph(store=SimpleMemory())
+    g.bind("dcat", DCAT)
+    g.bind("dct", DCT)
+    g.bind("dcterms", DCTERMS)
+    g.bind("xsd", XSD)
+    g.bind("freq", FREQ)
+    return g
+
+def quote_literal(value):
+    """Quote a string as an N-Triples/Turtle string literal in a single translate pass"""
+    return '"' + value.translate(NT_ESCAPES) + '"'
+
+def iri_ref(term):
+    """Format an IRI as <...>, refusing IRIs that would not parse back"""
+    if INVALID_IRI_CHARS.search(term):
+        raise ValueError(
+            f'"{term}" does not look like a valid URI, I cannot serialize this as N-Triples/Turtle'
+        )
+    return f"<{term}>"
+
+def nt_term(term):
+    """Format an RDF term in N-Triples syntax"""
+    if isinstance(term, Literal):
+        lexical = quote_literal(term)
+        if term.datatype is not None:
+            return f"{lexical}^^<{term.datatype}>"
+        return lexical
+    return iri_ref(term)
+
+def format_nt(triples):
+    """Format triples as an N-Triples document without building a graph"""
+    return ''.join(
+        f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n" for s, p, o in triples
+    )
+
+def turtle_term(term):
+    """Format an RDF term in Turtle syntax, using prefixed names where known"""
+    if isinstance(term, Literal):
+        lexical = quote_literal(term)
+        if term.datatype is not None:
+            return f"{lexical}^^{turtle_term(term.datatype)}"
+        return lexical
+    name = TURTLE_NAMES.get(term)
+    return name if name is not None else iri_ref(term)
+
+def turtle_header():
+    """Return the prefix declarations that start a Turtle document"""
+    return ''.join(
+        f"@prefix {prefix}: <{ns}> .\n" for prefix, ns in TURTLE_PREFIXES.items()
+    ) + "\n"
+
+def format_turtle(triples):
+    """Format triples as Turtle, one predicate-object block per subject, without building a graph"""
+    by_subject = {}
+    for s, p, o in triples:
+        by_subject.setdefault(s, []).append((p, o))
+    return ''.join(
+        f"{turtle_term(s)} "
+        + " ;\n    ".join(f"{turtle_term(p)} {turtle_term(o)}" for p, o in pairs)
+        + " .\n\n"
+        for s, pairs in by_subject.items()
+    )
+
+# Streamed RDF formats: (document header, triple formatter)
+TEXT_WRITERS = {
+    'turtle': (turtle_header, format_turtle),
+    'nt': (lambda: '', format_nt),
+}
+
+def convert_chunk(chunk, rdf_format=None, csv=True):
+    """Convert one chunk of input rows, formatting triples as text for streamed formats
+
+    Returns the number of rows converted along with the outputs; RDF is
+    skipped when `rdf_format` is None and the CSV tables when `csv` is False.
+    """
+    dc_triples, dc_df, dcat_triples, dcat_df = convert_rows(
+        chunk, rdf=rdf_format is not None, csv=csv
+    )
+    if rdf_format in TEXT_WRITERS:
+        # Text is much cheaper than rdflib terms to send back from a worker process
+        _, format_triples = TEXT_WRITERS[rdf_format]
+        dc_triples = format_triples(dc_triples)
+        dcat_triples = format_triples(dcat_triples)
+    return len(chunk), dc_triples, dc_df, dcat_triples, dcat_df
+
+def split_frame(df, parts):
+    """Split a DataFrame into at most `parts` contiguous row slices"""
+    step = max(1, -(-len(df) // parts))
+    return [df.iloc[start:start + step] for start in range(0, len(df), step)]
+
+@lru_cache(maxsize=None)
+def load_pyarrow():
+    """Import pyarrow and its CSV writer on first use; None when pyarrow is not installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pa, pacsv
+
+def write_csv(df, f, header=True):
+    """Append a DataFrame to an open binary CSV file, using pyarrow's writer when it is available"""
+    arrow = load_pyarrow()
+    if arrow is not None:
+        pa, pacsv = arrow
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns cannot be converted; let pandas write them
+            table = None
+        if table is not None:
+            pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=header))
+            return
+    df.to_csv(f, index=False, header=header, encoding='utf-8')
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--format', choices=['all', 'rdf', 'csv'], default='all',
+        help="outputs to write: both RDF and CSV, only RDF, or only CSV"
+    )
+    parser.add_argument(
+        '--rdf-format', choices=['turtle', 'nt', 'jelly'], default='turtle',
+        help="RDF output format; Turtle and N-Triples are streamed chunk by chunk, "
+             "Jelly builds in-memory graphs and requires pyjelly"
+    )
+    parser.add_argument(
+        '--chunksize', type=int, default=CHUNK_SIZE,
+        help="number of input rows converted at a time"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help="number of worker processes converting chunks in parallel (0 = one per CPU core)"
+    )
+    args = parser.parse_args()
+    if args.chunksize < 1:
+        parser.error("--chunksize must be a positive integer")
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    elif args.workers < 0:
+        parser.error("--workers must be 0 or a positive integer")
+    if (args.format != 'csv' and args.rdf_format == 'jelly'
+            and importlib.util.find_spec('pyjelly') is None):
+        parser.error("--rdf-format jelly requires pyjelly (pip install pyjelly)")
+    return args
 
 def main():
     """Main execution function"""
+    args = parse_args()
+    
     # Create output directory
     os.makedirs('output', exist_ok=True)
     
-    # Parse input CSV
-    print("Step 1: Parsing input CSV...")
-    df = parse_csv('assignment.csv')
-    if df is None:
+    # Open input CSV
+    print("Step 1: Opening input CSV...")
+    chunks = parse_csv('assignment.csv', args.chunksize)
+    if chunks is None:
         return
     
-    # Create Dublin Core outputs
-    print("\nStep 2: Creating Dublin Core metadata...")
-    dc_graph, dc_df = create_dublin_core_graph(df)
+    # Create Dublin Core and DCAT metadata chunk by chunk. CSV rows and
+    # Turtle/N-Triples text are appended as they are produced, while Jelly
+    # output needs the full graphs before serializing.
+    print("\nStep 2: Creating Dublin Core and DCAT metadata...")
+    write_rdf = args.format in ('all', 'rdf')
+    write_tables = args.format in ('all', 'csv')
+    extension = RDF_EXTENSIONS[args.rdf_format]
+    dc_rdf = f'output/dublin.{extension}'
+    dcat_rdf = f'output/dcat.{extension}'
+    stream_rdf = args.rdf_format in TEXT_WRITERS
     
-    # Save Dublin Core RDF (Turtle)
-    dc_graph.serialize(destination='output/dublin.ttl', format='turtle')
-    print("+ Created output/dublin.ttl")
+    # Outputs are written next to their final paths and only renamed into
+    # place once the whole input has converted, so a failed run leaves the
+    # previous outputs untouched
+    outputs = []
+    if write_rdf:
+        outputs += [dc_rdf, dcat_rdf]
+    if write_tables:
+        outputs += ['output/dublin.csv', 'output/dcat.csv']
+    temp = {path: path + '.tmp' for path in outputs}
     
-    # Save Dublin Core CSV
-    dc_df.to_csv('output/dublin.csv', index=False)
-    print("+ Created output/dublin.csv")
+    total = 0
+    try:
+        with ExitStack() as stack:
+            if write_tables:
+                dc_csv = stack.enter_context(open(temp['output/dublin.csv'], 'wb'))
+                dcat_csv = stack.enter_context(open(temp['output/dcat.csv'], 'wb'))
+                write_csv(pd.DataFrame(columns=DUBLIN_COLUMNS), dc_csv)
+                write_csv(pd.DataFrame(columns=DCAT_COLUMNS), dcat_csv)
+            
+            if write_rdf and stream_rdf:
+                header, _ = TEXT_WRITERS[args.rdf_format]
+                dc_out = stack.enter_context(open(temp[dc_rdf], 'w', encoding='utf-8'))
+                dcat_out = stack.enter_context(open(temp[dcat_rdf], 'w', encoding='utf-8'))
+                dc_out.write(header())
+                dcat_out.write(header())
+            elif write_rdf:
+                dc_graph = new_graph()
+                dcat_graph = new_graph()
+            
+            convert = partial(
+                convert_chunk,
+                rdf_format=args.rdf_format if write_rdf else None,
+                csv=write_tables
+            )
+            if args.workers > 1:
+                # Rows convert independently, so each chunk is sharded across the
+                # pool; imap keeps the results in input order
+                pool = stack.enter_context(mp.Pool(args.workers))
+                shards = (
+                    shard for chunk in chunks
+                    for shard in split_frame(chunk, args.workers)
+                )
+                results = pool.imap(convert, shards)
+            else:
+                results = map(convert, chunks)
+            
+            for rows, dc_part, dc_df, dcat_part, dcat_df in results:
+                if write_tables:
+                    write_csv(dc_df, dc_csv, header=False)
+                    write_csv(dcat_df, dcat_csv, header=False)
+                if write_rdf and stream_rdf:
+                    dc_out.write(dc_part)
+                    dcat_out.write(dcat_part)
+                elif write_rdf:
+                    dc_graph.addN((s, p, o, dc_graph) for s, p, o in dc_part)
+                    dcat_graph.addN((s, p, o, dcat_graph) for s, p, o in dcat_part)
+                total += rows
+        
+        if write_rdf and not stream_rdf:
+            dc_graph.serialize(destination=temp[dc_rdf], format=args.rdf_format)
+            dcat_graph.serialize(destination=temp[dcat_rdf], format=args.rdf_format)
+    except CSVReadError as e:
+        discard_files(temp.values())
+        print(f"Error reading CSV: {e}")
+        return
+    except BaseException:
+        discard_files(temp.values())
+        raise
     
-    # Create DCAT outputs
-    print("\nStep 3: Creating DCAT metadata...")
-    dcat_graph, dcat_df = create_dcat_graph(df)
+    for path in outputs:
+        os.replace(temp[path], path)
     
-    # Save DCAT RDF (Turtle)
-    dcat_graph.serialize(destination='output/dcat.ttl', format='turtle')
-    print("+ Created output/dcat.ttl")
+    created = []
+    if write_rdf:
+        created += [(dc_rdf, "Dublin Core RDF"), (dcat_rdf, "DCAT RDF")]
+    if write_tables:
+        created += [('output/dublin.csv', "Dublin Core CSV"), ('output/dcat.csv', "DCAT CSV")]
     
-    # Save DCAT CSV
-    dcat_df.to_csv('output/dcat.csv', index=False)
-    print("+ Created output/dcat.csv")
+    print(f"Converted {total} records from assignment.csv")
+    for path, _ in created:
+        print(f"+ Created {path}")
     
     print("\n" + "="*50)
     print("Conversion completed successfully!")
     print("Output files created in 'output/' directory:")
-    print("  - dublin.ttl (Dublin Core RDF)")
-    print("  - dublin.csv (Dublin Core CSV)")
-    print("  - dcat.ttl (DCAT RDF)")
-    print("  - dcat.csv (DCAT CSV)")
+    for path, label in created:
+        print(f"  - {os.path.basename(path)} ({label})")
     print("="*50)
 
 if __name__ == "__main__":